@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.interpolate import interp1d
 from scipy.optimize import root_scalar
 from  scipy.integrate import solve_ivp
 from waverider_generator.flowfield import cone_angle,cone_field
@@ -89,6 +88,7 @@ class waverider():
         if not (self.X4>=0 and self.X4<=1):
             raise ValueError("X4 must be between 0 and 1")
         
+        # n_upper_surface and n_shockwave are only validated, both curves are evaluated exactly
         if not isinstance(n_upper_surface,int) or n_upper_surface<10:
             raise ValueError('number of points on the upper surface for interpolation must be an integer greater than or equal to 10')
         
@@ -130,8 +130,14 @@ class waverider():
         #computes self.theta, the deflection angle corresponding to a shock angle in oblique shock relations
         self.Compute_Deflection_Angle()
 
+        # shock and deflection angles in radians and their tangents
+        self.beta_rad=self.beta*np.pi/180
+        self.theta_rad=self.theta*np.pi/180
+        self.tan_beta=np.tan(self.beta_rad)
+        self.tan_theta=np.tan(self.theta_rad)
+
         # obtain length of waverider from tip to base plane
-        self.length=height/np.tan(self.beta*np.pi/180)
+        self.length=height/self.tan_beta
 
         ''''
         +--------------------------------------------------+
@@ -156,6 +162,11 @@ class waverider():
         self.s_P3=self.s_cp[3,:]
         self.s_P4=self.s_cp[4,:]
 
+        # z and y_bar of the control points stored separately as floats
+        # used by the bezier evaluations
+        self.s_z=tuple(self.s_cp[:,0].tolist())
+        self.s_y=tuple(self.s_cp[:,1].tolist())
+
         ''''
         +---------------------------------------------+
         | define the upper surface via control points |
@@ -181,16 +192,9 @@ class waverider():
         self.us_P2=self.us_cp[2,:]
         self.us_P3=self.us_cp[3,:]
 
-        ''''
-        +-------------------------------------------------------------------+
-        | create interpolation objects for shockwave and upper surface curve|
-        +-------------------------------------------------------------------+
-        '''
-        # create an interpolation object for upper surface curve and curved part of the shockwave:
-        # self.Interpolate_Upper_Surface
-        # self.Interpolate_Shockwave
-        self.Create_Interpolated_Upper_Surface(n=n_upper_surface)
-        self.Create_Interpolated_Shockwave(n=n_shockwave)
+        # z and y_bar of the control points stored separately as floats
+        self.us_z=tuple(self.us_cp[:,0].tolist())
+        self.us_y=tuple(self.us_cp[:,1].tolist())
 
         ''''
         +------------------------------------------------------------------+
@@ -202,10 +206,17 @@ class waverider():
         self.z_local_shockwave=np.linspace(0,self.width,self.n_planes+2)
         self.z_local_shockwave=self.z_local_shockwave[1:-1] 
 
+        # mask of the planes in the curved region of the shockwave
+        self.curved_planes=(self.z_local_shockwave>self.X1*self.width) & (self.X2!=0)
+
         #obtain the y_bar values for the z sample in self.y_local_shockwave
         self.y_local_shockwave=np.zeros((self.n_planes,1))
         self.Get_Shockwave_Curve()
 
+        # obtain the bezier parameter t of the curved planes in self.t_shockwave
+        self.t_shockwave=np.zeros(self.n_planes)
+        self.Compute_t_Values()
+
         #obtain the intersection with the upper surface in self.local_intersections_us
         self.local_intersections_us=np.zeros((self.n_planes,2))
         self.Find_Intersections_With_Upper_Surface()
@@ -234,26 +245,26 @@ class waverider():
         +---------------------------+
         '''
         # next step is to compute the upper surface
+        # parameter from 0 to 1 along the streamwise direction, shared by all streams
+        self.alpha_streamwise=np.linspace(0,1,self.n_streamwise)
+
         # stored in this format for easy visualisation in matplotlib
-        self.upper_surface_x=np.zeros((self.n_planes+1,self.n_streamwise))
-        self.upper_surface_y=np.zeros((self.n_planes+1,self.n_streamwise))
-        self.upper_surface_z=np.zeros((self.n_planes+1,self.n_streamwise))
+        # rows are the symmetry plane, the osculating planes and the tip
+        self.upper_surface_x=np.zeros((self.n_planes+2,self.n_streamwise))
+        self.upper_surface_y=np.zeros((self.n_planes+2,self.n_streamwise))
+        self.upper_surface_z=np.zeros((self.n_planes+2,self.n_streamwise))
 
         # add the symmetry plane
-        self.upper_surface_x[0,:]=np.linspace(0,self.length,self.n_streamwise)
+        self.upper_surface_x[0,:]=self.length*self.alpha_streamwise
         self.upper_surface_y[0,:]=0
         self.upper_surface_z[0,:]=0
 
         self.Compute_Upper_Surface()
 
         # add the tip point
-        x_tip = np.full((1, self.n_streamwise), self.length)
-        y_tip =np.full((1,self.n_streamwise),self.height*self.X2-self.height)
-        z_tip =np.full((1,self.n_streamwise),self.width)
-
-        self.upper_surface_x= np.vstack([self.upper_surface_x, x_tip])
-        self.upper_surface_y= np.vstack([self.upper_surface_y, y_tip])
-        self.upper_surface_z= np.vstack([self.upper_surface_z, z_tip])
+        self.upper_surface_x[-1,:]=self.length
+        self.upper_surface_y[-1,:]=self.height*self.X2-self.height
+        self.upper_surface_z[-1,:]=self.width
 
         # store in a streams format 
         self.upper_surface_streams=[]
@@ -278,31 +289,36 @@ class waverider():
     # convert the upper surface streams to the desired format
     def Streams_Format(self):
 
-        for i in range(self.n_planes+2):
+        # all streams stored contiguously in a single (n_planes+2,n_streamwise,3) array
+        self.upper_surface_streams_array=np.stack([self.upper_surface_x,self.upper_surface_y,self.upper_surface_z],axis=-1)
 
-            x=self.upper_surface_x[i,:]
-            y=self.upper_surface_y[i,:]
-            z=self.upper_surface_z[i,:]
-            self.upper_surface_streams.append(np.vstack([x,y,z]).T)
+        # the streams in the list are views into the array
+        for i in range(self.n_planes+1):
+            self.upper_surface_streams.append(self.upper_surface_streams_array[i])
 
-            # keep only twice the same point for the tip
-            if i==self.n_planes+1:
-                self.upper_surface_streams[i]=self.upper_surface_streams[i][0:2,:]
+        # keep only twice the same point for the tip
+        self.upper_surface_streams.append(self.upper_surface_streams_array[-1,0:2,:])
 
     def Streamline_Tracing(self):
 
         # propagate the streamlines
-        Vr, Vt = cone_field(self.M_inf,self.cone_angle*np.pi/180,self.beta*np.pi/180,self.gamma)
+        Vr, Vt = cone_field(self.M_inf,self.cone_angle*np.pi/180,self.beta_rad,self.gamma)
 
         # ODE which propagates the streamlines
         def stode(t, x, y_max):
 
             th = np.arctan(x[1] / x[0])
+
+            # evaluate the splines and trigonometric functions once per call
+            vr = Vr(th)
+            vt = Vt(th)
+            cos_th = np.cos(th)
+            sin_th = np.sin(th)
             
             dxdt = np.zeros(2)
             
-            dxdt[0] = Vr(th) * np.cos(th) - np.sin(th) * Vt(th)
-            dxdt[1] = Vr(th) * np.sin(th) + np.cos(th) * Vt(th)
+            dxdt[0] = vr * cos_th - sin_th * vt
+            dxdt[1] = vr * sin_th + cos_th * vt
             
             return dxdt
         
@@ -325,147 +341,204 @@ class waverider():
         local_intersections_us=self.local_intersections_us
         local_intersections_us=np.vstack((np.array([[0,self.height]]),local_intersections_us,np.array([[self.width,self.X2*self.height]])))
 
-        for i,le_point in enumerate(leading_edge):
-            # tip
-            if i==len(leading_edge)-1:
-                stream=np.vstack((le_point,le_point))
-                self.lower_surface_streams.append(stream)
+        # symmetry plane and planes in the flat region, the tip is excluded
+        flat=np.concatenate(([True],~self.curved_planes))
 
-            # flat region
-            elif z_local_shockwave[i,0]<=self.X1*self.width or self.X2==0:
+        streams=[None]*len(leading_edge)
 
-                # trigonometry with deflection angle
-                bottom_surface_y=le_point[1]-np.tan(self.theta*np.pi/180)*(self.length-le_point[0])
+        # flat region
+        # all streams are straight lines built in a single (n_flat,n_streamwise,3) array
+        le_flat=leading_edge[:-1][flat]
 
-                # store the x,y and z in a streams
-                x=np.linspace(le_point[0],self.length,self.n_streamwise)[:,None]
-                y=np.linspace(le_point[1],bottom_surface_y,self.n_streamwise)[:,None]
-                z=np.full((y.shape),le_point[2])
+        # trigonometry with deflection angle
+        bottom_surface_y=le_flat[:,1]-self.tan_theta*(self.length-le_flat[:,0])
 
-                self.lower_surface_streams.append(np.column_stack([x,y,z]))
+        # parameter along the streams
+        t=self.alpha_streamwise[None,:]
 
-            # curved region
-            else:
+        flat_streams=np.empty((le_flat.shape[0],self.n_streamwise,3))
+        flat_streams[:,:,0]=le_flat[:,0:1]+(self.length-le_flat[:,0:1])*t
+        flat_streams[:,:,1]=le_flat[:,1:2]+(bottom_surface_y[:,None]-le_flat[:,1:2])*t
+        flat_streams[:,:,2]=le_flat[:,2:3]
+
+        for i,stream in zip(np.flatnonzero(flat),flat_streams):
+            streams[i]=stream
+
+        # curved region
+        # need calculate R minus height of osculating plane
+        # distances for all planes at once with the y coordinates converted to global in one go
+        eta_le_planes=Euclidean_Distance(
+            local_intersections_us[:,0],
+            self.Local_to_Global(local_intersections_us[:,1]),
+            cone_centers[:,2],
+            cone_centers[:,1]
+        )
+        r_planes=Euclidean_Distance(
+            z_local_shockwave[:,0],
+            self.Local_to_Global(y_local_shockwave[:,0]),
+            cone_centers[:,2],
+            cone_centers[:,1]
+        )
+
+        # calculate the angles to rotate the streamlines by, index shifted by the symmetry plane
+        m,_,_=self.First_Derivative(self.t_shockwave)
+        alpha_planes=np.concatenate(([0],np.arctan(m)))
+
+        # bind attributes used in the loop to locals
+        tan_beta=self.tan_beta
+        max_step=self.delta_streamwise*self.length
+
+        for i in np.flatnonzero(~flat):
 
-                # need calculate R minus height of osculating plane
-                eta_le=Euclidean_Distance(
-                    local_intersections_us[i,0],
-                    self.Local_to_Global(local_intersections_us[i,1]),
-                    cone_centers[i,2],
-                    cone_centers[i,1]
-                ) 
-                r=Euclidean_Distance(
-                    z_local_shockwave[i,0],
-                    self.Local_to_Global(y_local_shockwave[i,0]),
-                    cone_centers[i,2],
-                    cone_centers[i,1]
-                ) 
-
-                # calculate the angle to rotate the streamlines by
-                m,_,_=self.Get_First_Derivative(z_local_shockwave[i,0])
-                alpha=np.arctan(m)
-
-                x_le=(eta_le)/ np.tan(self.beta*np.pi/180) 
-
-                sol = solve_ivp(stode, (0, 1000), [x_le, eta_le], events=back, args=(r / np.tan(self.beta*np.pi/180),), max_step=self.delta_streamwise*self.length)
-                stream = np.vstack([sol.y[0], -sol.y[1] * np.cos(alpha), sol.y[1] * np.sin(alpha)]).T
-
-                # transform from cone center coordinate system to global
-                stream[:,0]=stream[:,0]+cone_centers[i,0]
-                stream[:,1]=stream[:,1]+cone_centers[i,1]
-                stream[:,2]=stream[:,2]+cone_centers[i,2]
-
-                # append
-                self.lower_surface_streams.append(stream)
+            eta_le=eta_le_planes[i]
+            r=r_planes[i]
+            alpha=alpha_planes[i]
+
+            x_le=(eta_le)/tan_beta
+
+            sol = solve_ivp(stode, (0, 1000), [x_le, eta_le], events=back, args=(r/tan_beta,), max_step=max_step)
+            stream = np.vstack([sol.y[0], -sol.y[1] * np.cos(alpha), sol.y[1] * np.sin(alpha)]).T
+
+            # transform from cone center coordinate system to global
+            stream[:,0]=stream[:,0]+cone_centers[i,0]
+            stream[:,1]=stream[:,1]+cone_centers[i,1]
+            stream[:,2]=stream[:,2]+cone_centers[i,2]
+
+            streams[i]=stream
+
+        # tip
+        streams[-1]=np.vstack((leading_edge[-1],leading_edge[-1]))
+
+        self.lower_surface_streams.extend(streams)
 
     def Compute_Upper_Surface(self):
-        
-        for i in range(0,self.n_planes):
-            self.upper_surface_x[i+1,:]=np.linspace(self.leading_edge[i+1,0],self.length,self.n_streamwise)
-            self.upper_surface_y[i+1,:]=np.linspace(self.leading_edge[i+1,1],self.Local_to_Global(self.local_intersections_us[i,1]),self.n_streamwise)
-            self.upper_surface_z[i+1,:]=np.linspace(self.leading_edge[i+1,2],self.local_intersections_us[i,0],self.n_streamwise)
+
+        # parameter along the streams, broadcast against the leading edge of every plane
+        alpha=self.alpha_streamwise[None,:]
+
+        # start at the leading edge and end at the upper surface intersection on the base plane
+        x0=self.leading_edge[1:-1,0:1]
+        y0=self.leading_edge[1:-1,1:2]
+        z0=self.leading_edge[1:-1,2:3]
+
+        y1=self.Local_to_Global(self.local_intersections_us[:,1:2])
+        z1=self.local_intersections_us[:,0:1]
+
+        self.upper_surface_x[1:-1,:]=x0+(self.length-x0)*alpha
+        self.upper_surface_y[1:-1,:]=y0+(y1-y0)*alpha
+        self.upper_surface_z[1:-1,:]=z0+(z1-z0)*alpha
         
     def Compute_Leading_Edge_And_Cone_Centers(self):
 
-        for i,z in enumerate(self.z_local_shockwave):
-             
-            if z<=self.X1*self.width or self.X2==0:
-                self.cone_centers[i,0]=self.length-((self.local_intersections_us[i,1]-self.y_local_shockwave[i,0])/np.tan(self.beta*np.pi/180))
-                self.cone_centers[i,1]=self.Local_to_Global(self.local_intersections_us[i,1])
-                self.cone_centers[i,2]=float(z)
+        # all planes are handled at once, split between flat and curved region
+        curved=self.curved_planes
+        flat=~curved
 
-                self.leading_edge[i+1,:]=self.cone_centers[i,:]
+        z=self.z_local_shockwave
 
-            else:
+        # global y coordinates of the shockwave and upper surface intersection
+        y_s=self.Local_to_Global(self.y_local_shockwave[:,0])
+        y_us=self.Local_to_Global(self.local_intersections_us[:,1])
 
-                #calculate corresponding t value
-                t=self.Find_t_Value(z)
-                # first derivative and radius
-                first_derivative,_,_=self.First_Derivative(t)
-                radius=self.Calculate_Radius_Curvature(t)
+        # leading edge points of the osculating planes (excludes symmetry plane and tip)
+        leading_edge=self.leading_edge[1:-1]
 
-                self.leading_edge[i+1,:]=self.cone_centers[i,:]
-                # get angle theta
-                theta=np.arctan(first_derivative)
-                
-                # get x value for cone center
-                self.cone_centers[i,0]=float(self.length-radius/np.tan(self.beta*np.pi/180))
-
-                # get y value for cone center
-                self.cone_centers[i,1]=float(self.Local_to_Global(self.y_local_shockwave[i,0])+np.cos(theta)*radius) 
-
-                # get z value for cone center
-                self.cone_centers[i,2]=float(z-radius*np.sin(theta))
-
-                # get the location of the intersection
-                self.leading_edge[i+1,:]=self.Intersection_With_Freestream_Plane(self.cone_centers[i,0],
-                                                                                self.cone_centers[i,1],
-                                                                                self.cone_centers[i,2],
-                                                                                self.length,
-                                                                                self.Local_to_Global(self.y_local_shockwave[i,0]),
-                                                                                z,
-                                                                                self.Local_to_Global(self.local_intersections_us[i,1]))
+        # flat region
+        self.cone_centers[flat,0]=self.length-((self.local_intersections_us[flat,1]-self.y_local_shockwave[flat,0])/self.tan_beta)
+        self.cone_centers[flat,1]=y_us[flat]
+        self.cone_centers[flat,2]=z[flat]
+
+        leading_edge[flat]=self.cone_centers[flat]
+
+        # curved region
+        t=self.t_shockwave[curved]
+
+        # first derivative and radius
+        # powers of t are shared between the derivative and the radius
+        powers=Bezier_Powers(t)
+        first_derivative,_,_=self.First_Derivative(t,powers)
+        radius=self.Calculate_Radius_Curvature(t,powers)
+
+        # get angle theta
+        theta=np.arctan(first_derivative)
+
+        # get x, y and z values for cone centers
+        self.cone_centers[curved,0]=self.length-radius/self.tan_beta
+        self.cone_centers[curved,1]=y_s[curved]+np.cos(theta)*radius
+        self.cone_centers[curved,2]=z[curved]-radius*np.sin(theta)
+
+        # get the location of the intersections with the local freestream plane y=y_us
+        # parametric line from the shock location to the cone center, stopped where y=y_us
+        k=(y_us[curved]-y_s[curved])/(self.cone_centers[curved,1]-y_s[curved])
+
+        leading_edge[curved,0]=self.length+k*(self.cone_centers[curved,0]-self.length)
+        leading_edge[curved,1]=y_us[curved]
+        leading_edge[curved,2]=z[curved]+k*(self.cone_centers[curved,2]-z[curved])
     
     # find all intersections with the upper surface
     def Find_Intersections_With_Upper_Surface(self):
 
-        for i,z in enumerate(self.z_local_shockwave):
+        curved=self.curved_planes
+        flat=~curved
 
-            if z<=self.X1*self.width or self.X2==0:
-                self.local_intersections_us[i,0]=z
-                self.local_intersections_us[i,1]=self.Interpolate_Upper_Surface(z)
-            else:
-                first_derivative,_,_=self.Get_First_Derivative(z)
-                # print(first_derivative)
-                intersection=self.Intersection_With_Upper_Surface(first_derivative=first_derivative,z_s=float(z),y_s=float(self.y_local_shockwave[i,:]))
-                self.local_intersections_us[i,:]=intersection
+        z=self.z_local_shockwave
 
-    # create an interp1d object for the shockwave curve 
-    def Create_Interpolated_Shockwave(self,n):
-        
-        t_values=np.linspace(0,1,n)
-        points=np.zeros((n,2))
+        # flat region, the osculating planes are vertical
+        self.local_intersections_us[flat,0]=z[flat]
+        self.local_intersections_us[flat,1]=self.Interpolate_Upper_Surface(z[flat])
+
+        # curved region
+        # the osculating planes are the lines normal to the shockwave
+        first_derivative,_,_=self.First_Derivative(self.t_shockwave[curved])
+        z_s=z[curved]
+        y_s=self.y_local_shockwave[curved,0]
+
+        c=y_s+(1/first_derivative)*z_s
+        m=-1/first_derivative
+
+        # solve m*z(t)+c=y(t) along the upper surface curve for all lines at once
+        def f(t):
+            powers=Bezier_Powers(t)
+            z=Bezier_Cubic(powers,*self.us_z)
+            y=Bezier_Cubic(powers,*self.us_y)
+            dzdt=Bezier_Cubic_First_Derivative(powers,*self.us_z)
+            dydt=Bezier_Cubic_First_Derivative(powers,*self.us_y)
+            return Equation_of_Line(z,m,c)-y,m*dzdt-dydt
+
+        # start from the point of the upper surface above the shockwave point
+        t,bracketed=Newton_Bisection(f,Bezier_Newton(z_s,self.us_z,Bezier_Cubic,Bezier_Cubic_First_Derivative))
+
+        # a line without a sign change over the bracket does not intersect the upper surface
+        if not np.all(bracketed):
+            raise ValueError(f"Osculating planes at z={z_s[~bracketed].tolist()} do not intersect the upper surface curve, check value of design parameters")
+
+        z_root=Bezier_Cubic(Bezier_Powers(t),*self.us_z)
+        self.local_intersections_us[curved,0]=z_root
+        self.local_intersections_us[curved,1]=Equation_of_Line(z_root,m,c)
 
-        for i,t in enumerate(t_values):
-            points[i,:]=self.Bezier_Shockwave(t)
+    # solve for the t values of all osculating planes in the curved region at once
+    def Compute_t_Values(self):
 
-        self.Interpolate_Shockwave=interp1d(points[:,0],points[:,1],kind='linear')
+        curved=self.curved_planes
+        z=self.z_local_shockwave[curved]
 
-    # creates an interp1d object for the upper surface, used to find intersection easily
-    # with root_scalar
-    def Create_Interpolated_Upper_Surface(self,n):
+        self.t_shockwave[curved]=Bezier_Newton(z,self.s_z,Bezier_Quartic,Bezier_Quartic_First_Derivative)
 
-        # values of t for the bezier curve
-        t_values=np.linspace(0,1,n)
+    # y_bar of the shockwave curve for a z value, z can be a float or an array
+    # evaluated exactly by solving for t on the bezier curve
+    def Interpolate_Shockwave(self,z):
 
-        points=np.zeros((n,2))
+        t=Bezier_Newton(z,self.s_z,Bezier_Quartic,Bezier_Quartic_First_Derivative)
 
-        # get points along the bezier curve representing the upper surface
-        for i, t in enumerate(t_values):
-            points[i, :] = self.Bezier_Upper_Surface(t)
+        return Bezier_Quartic(Bezier_Powers(t),*self.s_y)
 
-        # store interp1d objected as an attribute
-        self.Interpolate_Upper_Surface=interp1d(points[:,0],points[:,1],kind='linear')
+    # y_bar of the upper surface curve for a z value, z can be a float or an array
+    # evaluated exactly by solving for t on the bezier curve
+    def Interpolate_Upper_Surface(self,z):
+
+        t=Bezier_Newton(z,self.us_z,Bezier_Cubic,Bezier_Cubic_First_Derivative)
+
+        return Bezier_Cubic(Bezier_Powers(t),*self.us_y)
 
     """
     AUXILIARY FUNCTIONS    
@@ -505,47 +578,62 @@ class waverider():
 
         return first_derivative,dzdt,dydt
 
-    # get the y_bar coordinates of all points along the shockwave curve by means of 
-    # interpolation
+    # get the y_bar coordinates of all points along the shockwave curve
+    # evaluated for all planes at once
     def Get_Shockwave_Curve(self):
 
-        for i,z in enumerate(self.z_local_shockwave):
-            if z<=self.width*self.X1:
-                self.y_local_shockwave[i,0]=0
-            else:
-                self.y_local_shockwave[i,0]=float(self.Interpolate_Shockwave(float(z)))
+        # the shockwave is flat (y_bar=0) outside of the curved planes, including everywhere when X2=0
+        curved=self.curved_planes
+
+        self.y_local_shockwave[~curved,0]=0
+        self.y_local_shockwave[curved,0]=self.Interpolate_Shockwave(self.z_local_shockwave[curved])
     
     # bezier curve defining the shockwave
     # returns np.array([z,y])
     def Bezier_Shockwave(self,t):
 
-        point=(1-t)**4*self.s_P0+4*(1-t)**3*t*self.s_P1+6*(1-t)**2*t**2*self.s_P2+4*(1-t)*t**3*self.s_P3+t**4*self.s_P4
+        powers=Bezier_Powers(t)
+        z=Bezier_Quartic(powers,*self.s_z)
+        y=Bezier_Quartic(powers,*self.s_y)
 
-        return point
+        return np.array([z,y])
     
     # returns slope m, dz/dt and dy/dt
-    def First_Derivative(self, t):
+    # powers can be passed if already computed with Bezier_Powers(t)
+    def First_Derivative(self, t, powers=None):
+
+        if powers is None:
+            powers=Bezier_Powers(t)
 
-        first_derivative = 4 * (1-t)**3 * (self.s_P1 - self.s_P0) + 12 * (1-t)**2 * t * (self.s_P2 - self.s_P1) + 12 * (1-t) * t**2 * (self.s_P3 - self.s_P2) + 4 * t**3 * (self.s_P4 - self.s_P3)
+        dzdt=Bezier_Quartic_First_Derivative(powers,*self.s_z)
+        dydt=Bezier_Quartic_First_Derivative(powers,*self.s_y)
     
-        return first_derivative[1]/first_derivative[0],first_derivative[0],first_derivative[1]
+        return dydt/dzdt,dzdt,dydt
     
     # returns components of second derivative of point along shockwave curve with respect to t
     # z and y respectively
-    def Second_Derivative(self, t):
+    # powers can be passed if already computed with Bezier_Powers(t)
+    def Second_Derivative(self, t, powers=None):
+
+        if powers is None:
+            powers=Bezier_Powers(t)
 
-        second_derivative = 12 * (1-t)**2 * (self.s_P2 - 2 * self.s_P1 + self.s_P0) + 24 * (1-t) * t * (self.s_P3 - 2 * self.s_P2 + self.s_P1) + 12 * t**2 * (self.s_P4 - 2 * self.s_P3 + self.s_P2)
-        return second_derivative[0],second_derivative[1]
+        dzdt2=Bezier_Quartic_Second_Derivative(powers,*self.s_z)
+        dydt2=Bezier_Quartic_Second_Derivative(powers,*self.s_y)
+
+        return dzdt2,dydt2
     
     # Bezier curve of upper surface
     # output is an np.array([z,y]) in local coordinates
     def Bezier_Upper_Surface(self, t):
 
-        point = (1 - t)**3 * self.us_P0 + 3 * (1 - t)**2 * t * self.us_P1 + 3 * (1 - t) * t**2 * self.us_P2 + t**3 * self.us_P3
+        powers=Bezier_Powers(t)
+        z=Bezier_Cubic(powers,*self.us_z)
+        y=Bezier_Cubic(powers,*self.us_y)
 
-        return point
+        return np.array([z,y])
     
-    #convert from local to global y coordinate
+    #convert from local to global y coordinate, y can be a float or an array
     def Local_to_Global(self,y):
 
         y=y-self.height
@@ -578,27 +666,117 @@ class waverider():
 
 
     # calculate the radius of curvature for a given t along the bezier curve
-    def Calculate_Radius_Curvature(self,t):
+    # t can be a float or an array, powers can be passed if already computed with Bezier_Powers(t)
+    def Calculate_Radius_Curvature(self,t,powers=None):
+
+        if powers is None:
+            powers=Bezier_Powers(t)
         
-        _,dzdt,dydt=self.First_Derivative(float(t))
-        dzdt2,dydt2=self.Second_Derivative(float(t))
+        _,dzdt,dydt=self.First_Derivative(t,powers)
+        dzdt2,dydt2=self.Second_Derivative(t,powers)
 
-        radius= 1/(abs((dzdt*dydt2-dydt*dzdt2))/((dzdt**2+dydt**2)**(3/2)))
+        radius= 1/(np.abs((dzdt*dydt2-dydt*dzdt2))/((dzdt**2+dydt**2)**(3/2)))
 
         return radius
 
     # find the t value which corresponds to a z value
     def Find_t_Value(self,z):
 
-        def f(t):
-            return self.Bezier_Shockwave(t)[0]-z
-        
-        intersection=root_scalar(f,bracket=[0,1])
-
-        return intersection.root
+        return Bezier_Newton(z,self.s_z,Bezier_Quartic,Bezier_Quartic_First_Derivative)
 
 '''EXTERNAL AUXILIARY FUNCTIONS'''
 
+# powers of (1-t) and t up to the fourth, shared by the bezier functions below
+# t can be a float or an array
+# explicit products are used as they are cheaper than ** for small integer powers
+def Bezier_Powers(t):
+    omt=1-t
+    omt2=omt*omt
+    t2=t*t
+    return omt,omt2,omt2*omt,omt2*omt2,t,t2,t2*t,t2*t2
+
+# one component of a quartic bezier curve from the same component of its
+# control points P0 to P4, powers is the output of Bezier_Powers
+def Bezier_Quartic(powers,P0,P1,P2,P3,P4):
+    omt,omt2,omt3,omt4,t,t2,t3,t4=powers
+    return omt4*P0+4*omt3*t*P1+6*omt2*t2*P2+4*omt*t3*P3+t4*P4
+
+# one component of a cubic bezier curve from the same component of its
+# control points P0 to P3, powers is the output of Bezier_Powers
+def Bezier_Cubic(powers,P0,P1,P2,P3):
+    omt,omt2,omt3,_,t,t2,t3,_=powers
+    return omt3*P0+3*omt2*t*P1+3*omt*t2*P2+t3*P3
+
+# first derivative with respect to t of one component of a quartic bezier curve
+def Bezier_Quartic_First_Derivative(powers,P0,P1,P2,P3,P4):
+    omt,omt2,omt3,_,t,t2,t3,_=powers
+    return 4*omt3*(P1-P0)+12*omt2*t*(P2-P1)+12*omt*t2*(P3-P2)+4*t3*(P4-P3)
+
+# first derivative with respect to t of one component of a cubic bezier curve
+def Bezier_Cubic_First_Derivative(powers,P0,P1,P2,P3):
+    omt,omt2,_,_,t,t2,_,_=powers
+    return 3*omt2*(P1-P0)+6*omt*t*(P2-P1)+3*t2*(P3-P2)
+
+# second derivative with respect to t of one component of a quartic bezier curve
+def Bezier_Quartic_Second_Derivative(powers,P0,P1,P2,P3,P4):
+    omt,omt2,_,_,t,t2,_,_=powers
+    return 12*omt2*(P2-2*P1+P0)+24*omt*t*(P3-2*P2+P1)+12*t2*(P4-2*P3+P2)
+
+# finds the roots in t over the bracket [0,1] of a batch of equations using a vectorised
+# newton iteration safeguarded by bisection
+# f returns the residual and its derivative with respect to t, t0 is the initial guess
+# returns t and a mask of the equations which have a sign change over the bracket
+def Newton_Bisection(f,t0):
+
+    t=np.array(t0,dtype=float)
+
+    lower=np.zeros_like(t)
+    upper=np.ones_like(t)
+    f_lower,_=f(lower)
+    f_upper,_=f(upper)
+    bracketed=np.sign(f_lower)!=np.sign(f_upper)
+
+    for _ in range(100):
+        residual,derivative=f(t)
+
+        # shrink the bracket around the root
+        same_side=np.sign(residual)==np.sign(f_lower)
+        lower=np.where(same_side,t,lower)
+        f_lower=np.where(same_side,residual,f_lower)
+        upper=np.where(same_side,upper,t)
+
+        with np.errstate(divide='ignore',invalid='ignore'):
+            t_new=t-residual/derivative
+
+        # bisect when the newton step leaves the bracket, keep exact roots
+        outside=~((t_new>=lower) & (t_new<=upper))
+        t_new=np.where(outside,0.5*(lower+upper),t_new)
+        t_new=np.where(residual==0,t,t_new)
+
+        converged=np.all((np.abs(t_new-t)<=1e-15) | (residual==0) | ~bracketed)
+        t=t_new
+        if converged:
+            break
+
+    return t,bracketed
+
+# finds the t values for which the z component of a bezier curve equals z,
+# z can be a float or an array
+# z_cp are the z coordinates of the control points, curve and derivative are the
+# matching Bezier_* functions, z outside of the curve is clipped to its end points
+def Bezier_Newton(z,z_cp,curve,derivative):
+
+    z=np.clip(z,z_cp[0],z_cp[-1])
+
+    def f(t):
+        powers=Bezier_Powers(t)
+        return curve(powers,*z_cp)-z,derivative(powers,*z_cp)
+
+    # initial guess from the linear span of the control points
+    t,_=Newton_Bisection(f,(z-z_cp[0])/(z_cp[-1]-z_cp[0]))
+
+    return t
+
 # calculates the euclidean distance between two points in 2D
 def Euclidean_Distance(x1,y1,x2,y2):
     return np.sqrt((x2-x1)**2+(y2-y1)**2)